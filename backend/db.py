@@ -1,4 +1,7 @@
-from sqlalchemy import create_engine, MetaData
+from asyncio import current_task
+
+from sqlalchemy import MetaData
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -9,18 +12,26 @@ DATABASE_PASSWORD = config.DATABASE_PASSWORD
 DATABASE_HOST = config.DATABASE_HOST
 DATABASE_NAME = config.DATABASE_NAME
 
-SQLALCHEMY_DATABASE_URL = f"postgresql://{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_HOST}/{DATABASE_NAME}"
+SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_HOST}/{DATABASE_NAME}"
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL,
+                             pool_size=20,
+                             max_overflow=10,
+                             pool_timeout=30,
+                             pool_pre_ping=True,
+                             pool_recycle=3600)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, bind=engine,
+                 class_=AsyncSession, expire_on_commit=False),
+    scopefunc=current_task)
 
 Base = declarative_base()
 metadata = MetaData()
 
-def get_db():
+async def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        await SessionLocal.remove()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Integer
+from sqlalchemy import Column, String, Text, DateTime, Integer, Index
 
 
 from backend.db import Base
@@ -7,10 +7,13 @@ from backend.db import Base
 
 class Task(Base):
     __tablename__ = "task"
+    __table_args__ = (
+        Index("ix_task_status_duedate", "status", "dueDate"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     createdDate = Column(DateTime, default=datetime.now)
-    dueDate = Column(DateTime, default=datetime.now)
+    dueDate = Column(DateTime, default=datetime.now, index=True)
     title = Column(String(50))
     description = Column(Text)
     status = Column(String(50))
@@ -1,6 +1,7 @@
-from typing import List
-from fastapi import APIRouter, Depends, status, Response, Request
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status, Response, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend import db
 
@@ -8,6 +9,9 @@ from .import schema
 from .import services
 
 
+# task.id is an int4 column; asyncpg rejects larger ids with a DataError
+MAX_TASK_ID = 2147483647
+
 router = APIRouter(
     tags=["Task"],
     prefix='/tasks'
@@ -16,29 +20,37 @@ router = APIRouter(
 
 @router.post('/', status_code=status.HTTP_201_CREATED,
              response_model=schema.TaskBase)
-async def create_new_task(request: schema.TaskBase, database: Session = Depends(db.get_db)):
+async def create_new_task(request: schema.TaskBase, database: AsyncSession = Depends(db.get_db)):
     result = await services.create_new_task(request, database)
     return result
 
 
 @router.get('/', status_code=status.HTTP_200_OK,
             response_model=List[schema.TaskList])
-async def task_list(database: Session = Depends(db.get_db)):
-    result = await services.get_task_listing(database)
-    return result
+async def task_list(limit: int = Query(50, ge=1, le=500),
+                    offset: Optional[int] = Query(None, ge=0, le=MAX_TASK_ID),
+                    last_seen_id: Optional[int] = Query(None, ge=1, le=MAX_TASK_ID),
+                    database: AsyncSession = Depends(db.get_db)):
+    if offset is not None and last_seen_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Use either offset or last_seen_id, not both"
+        )
+    result = await services.get_task_listing(database, limit, offset or 0, last_seen_id)
+    return ORJSONResponse(content=[schema.TaskList.from_orm(task).dict() for task in result])
 
 
 @router.get('/{task_id}', status_code=status.HTTP_200_OK, response_model=schema.TaskBase)
-async def get_task_by_id(task_id: int, database: Session = Depends(db.get_db)):                            
+async def get_task_by_id(task_id: int = Path(..., ge=1, le=MAX_TASK_ID), database: AsyncSession = Depends(db.get_db)):                            
     return await services.get_task_by_id(task_id, database)
 
 
 @router.delete('/{task_id}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
-async def delete_task_by_id(task_id: int,
-                                database: Session = Depends(db.get_db)):
+async def delete_task_by_id(task_id: int = Path(..., ge=1, le=MAX_TASK_ID),
+                                database: AsyncSession = Depends(db.get_db)):
     return await services.delete_task_by_id(task_id, database)
 
 
 @router.patch('/{task_id}', status_code=status.HTTP_200_OK, response_model=schema.TaskBase)
-async def update_task_by_id(request: schema.TaskUpdate, task_id: int, database: Session = Depends(db.get_db)):                            
+async def update_task_by_id(request: schema.TaskUpdate, task_id: int = Path(..., ge=1, le=MAX_TASK_ID), database: AsyncSession = Depends(db.get_db)):                            
     return await services.update_task_by_id(request, task_id, database)
\ No newline at end of file
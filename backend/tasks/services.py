@@ -1,25 +1,30 @@
 from fastapi import HTTPException, status
 from typing import List
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import raiseload
 from . import model
 from datetime import datetime
 
 
 async def create_new_task(request, database) -> model.Task:
-    new_task = model.Task(title=request.title, description=request.description, status=request.status,
-                            createdDate=datetime.now(), dueDate=request.dueDate)
+    new_task = model.Task(**request.dict(exclude={"id"}), createdDate=datetime.now())
     database.add(new_task)
-    database.commit()
-    database.refresh(new_task)
+    await database.commit()
     return new_task
 
 
-async def get_task_listing(database) -> List[model.Task]:
-    tasks = database.query(model.Task).all()
-    return tasks
+async def get_task_listing(database, limit, offset, last_seen_id=None) -> List[model.Task]:
+    query = select(model.Task).options(raiseload("*")).order_by(model.Task.id.desc())
+    if last_seen_id is not None:
+        query = query.where(model.Task.id < last_seen_id)
+    else:
+        query = query.offset(offset)
+    result = await database.execute(query.limit(limit))
+    return result.scalars().all()
 
 
 async def get_task_by_id(task_id, database):
-    task = database.query(model.Task).filter_by(id=task_id).first()
+    task = await database.get(model.Task, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -29,22 +34,27 @@ async def get_task_by_id(task_id, database):
 
 
 async def delete_task_by_id(task_id, database):
-    database.query(model.Task).filter(
-        model.Task.id == task_id).delete()
-    database.commit()
+    await database.execute(delete(model.Task).where(
+        model.Task.id == task_id))
+    await database.commit()
 
 
 async def update_task_by_id(request, task_id, database):
-    task = database.query(model.Task).filter_by(id=task_id).first()
+    values = {key: value for key, value in request.dict(exclude_unset=True).items() if value}
+    if not values:
+        return await get_task_by_id(task_id, database)
+    result = await database.execute(
+        update(model.Task)
+        .where(model.Task.id == task_id)
+        .values(**values)
+        .returning(*model.Task.__table__.columns)
+        .execution_options(synchronize_session=False)
+    )
+    task = result.first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="task Not Found !"
         )
-    task.title = request.title if request.title else task.title
-    task.description = request.description if request.description else task.description
-    task.status = request.status if request.status else task.status
-    task.dueDate = request.dueDate if request.dueDate else task.dueDate
-    database.commit()
-    database.refresh(task)
+    await database.commit()
     return task
\ No newline at end of file
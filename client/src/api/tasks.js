@@ -0,0 +1,21 @@
+import axios from "axios";
+
+const TASKS_URL = "http://localhost:8000/tasks";
+const PAGE_SIZE = 500;
+
+export const fetchAllTasks = async () => {
+  let allTasks = [];
+  let lastSeenId = null;
+  while (true) {
+    const params = { limit: PAGE_SIZE };
+    if (lastSeenId !== null) {
+      params.last_seen_id = lastSeenId;
+    }
+    const responseData = await axios.get(TASKS_URL, { params });
+    allTasks = allTasks.concat(responseData.data);
+    if (responseData.data.length < PAGE_SIZE) {
+      return allTasks;
+    }
+    lastSeenId = responseData.data[responseData.data.length - 1].id;
+  }
+};
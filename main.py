@@ -1,15 +1,17 @@
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+import os
 import uvicorn
 
 from backend.tasks import router as task_router
 
 app = FastAPI(title="Fast API Scheduler",
     docs_url="/docs",
-    version="0.0.1")
+    version="0.0.1",
+    default_response_class=ORJSONResponse)
 
 origins = ["http://localhost:8080",]
 
@@ -41,7 +43,7 @@ async def root():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=int(os.getenv("WEB_CONCURRENCY", "1")))
 
 
     
\ No newline at end of file